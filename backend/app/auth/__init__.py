@@ -0,0 +1,3 @@
+from .user import AuthorizedUser, User
+
+__all__ = ["AuthorizedUser", "User"]
@@ -0,0 +1,5 @@
+#!/bin/bash
+
+uv venv
+source ./venv/bin/activate
+uv pip install -r requirements.txt
@@ -0,0 +1,5 @@
+#!/bin/bash
+
+source .venv/bin/activate
+
+uvicorn main:app --reload 
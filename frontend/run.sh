@@ -0,0 +1,3 @@
+#!/bin/bash
+
+yarn dev
\ No newline at end of file
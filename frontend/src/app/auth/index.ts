@@ -0,0 +1,9 @@
+const validateConfig = () => {
+  console.log("No auth extension enabled");
+};
+
+export const auth = {
+  validateConfig,
+  // Placeholder to not break existing code
+  getAuthHeaderValue: async () => "",
+};
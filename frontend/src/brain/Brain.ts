@@ -0,0 +1,18 @@
+import { CheckHealthData } from "./data-contracts";
+import { HttpClient, RequestParams } from "./http-client";
+
+export class Brain<SecurityDataType = unknown> extends HttpClient<SecurityDataType> {
+  /**
+   * @description Check health of application. Returns 200 when OK, 500 when not.
+   *
+   * @name check_health
+   * @summary Check Health
+   * @request GET:/_healthz
+   */
+  check_health = (params: RequestParams = {}) =>
+    this.request<CheckHealthData, any>({
+      path: `/_healthz`,
+      method: "GET",
+      ...params,
+    });
+}
@@ -0,0 +1,17 @@
+import { CheckHealthData } from "./data-contracts";
+
+export namespace Brain {
+  /**
+   * @description Check health of application. Returns 200 when OK, 500 when not.
+   * @name check_health
+   * @summary Check Health
+   * @request GET:/_healthz
+   */
+  export namespace check_health {
+    export type RequestParams = {};
+    export type RequestQuery = {};
+    export type RequestBody = never;
+    export type RequestHeaders = {};
+    export type ResponseBody = CheckHealthData;
+  }
+}
@@ -0,0 +1,7 @@
+/** HealthResponse */
+export interface HealthResponse {
+  /** Status */
+  status: string;
+}
+
+export type CheckHealthData = HealthResponse;
@@ -0,0 +1,23 @@
+import type { ReactNode } from "react";
+import { Toaster } from "sonner";
+
+// Removed theme provider import as it's causing build errors
+
+interface Props {
+  children: ReactNode;
+}
+
+/**
+ * A provider wrapping the whole app.
+ *
+ * You can add multiple providers here by nesting them,
+ * and they will all be applied to the app.
+ */
+export const AppProvider = ({ children }: Props) => {
+  return (
+    <>
+      {children}
+      <Toaster position="top-right" theme="dark" />
+    </>
+  );
+};
\ No newline at end of file
@@ -0,0 +1 @@
+export const DEFAULT_THEME = "dark";
\ No newline at end of file
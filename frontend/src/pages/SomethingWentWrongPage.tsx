@@ -0,0 +1,5 @@
+import { ProdErrorPage } from "../prod-components/ProdErrorPage";
+
+export default function SomethingWentWrongPage() {
+  return <ProdErrorPage text="Something went wrong." canRefresh={true} />;
+}
@@ -0,0 +1,5 @@
+import { type ReactNode, Suspense } from "react";
+
+export const SuspenseWrapper = ({ children }: { children: ReactNode }) => {
+  return <Suspense>{children}</Suspense>;
+};
@@ -0,0 +1,31 @@
+import { lazy, type ReactNode, Suspense } from "react";
+import { createBrowserRouter } from "react-router-dom";
+import { userRoutes } from "./user-routes";
+
+export const SuspenseWrapper = ({ children }: { children: ReactNode }) => {
+  return <Suspense>{children}</Suspense>;
+};
+
+const NotFoundPage = lazy(() => import("./pages/NotFoundPage"));
+const SomethingWentWrongPage = lazy(
+  () => import("./pages/SomethingWentWrongPage"),
+);
+
+export const router = createBrowserRouter(
+  [
+    ...userRoutes,
+    {
+      path: "*",
+      element: (
+        <SuspenseWrapper>
+          <NotFoundPage />
+        </SuspenseWrapper>
+      ),
+      errorElement: (
+        <SuspenseWrapper>
+          <SomethingWentWrongPage />
+        </SuspenseWrapper>
+      ),
+    },
+  ]
+);
\ No newline at end of file
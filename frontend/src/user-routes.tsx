@@ -0,0 +1,19 @@
+
+// THIS FILE IS AUTOGENERATED WHEN PAGES ARE UPDATED
+import { lazy } from "react";
+import { RouteObject } from "react-router";
+
+
+
+const App = lazy(() => import("./pages/App.tsx"));
+const BlockchainDemo = lazy(() => import("./pages/BlockchainDemo.tsx"));
+const Marketplace = lazy(() => import("./pages/Marketplace.tsx"));
+
+export const userRoutes: RouteObject[] = [
+
+	{ path: "/", element: <App />},
+	{ path: "/blockchain-demo", element: <BlockchainDemo />},
+	{ path: "/blockchaindemo", element: <BlockchainDemo />},
+	{ path: "/marketplace", element: <Marketplace />},
+
+];
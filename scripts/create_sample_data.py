@@ -0,0 +1,171 @@
+"""Create sample input layers for the SEP qualification-pack pipeline.
+
+Writes small fixture datasets (parcels, SSURGO-style soils, roads, an AOI
+boundary, an NLCD landcover summary and the program negative list) under
+``data/`` so the screening scripts can be exercised without hitting county
+or federal services.
+"""
+
+import os
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import shapely
+from shapely.geometry import Polygon
+
+DATA_DIR = "data"
+
+
+def _make_rect_polygons(bounds):
+    """Build axis-aligned rectangles from an (N, 4) bounds array.
+
+    One vectorized shapely.polygons call constructs every ring in a
+    single GEOS trip instead of one Python Polygon(...) per row, which
+    is what keeps scaled-up (N > 10k) sample sets cheap.
+    """
+    x0, y0, x1, y1 = (bounds[:, i] for i in range(4))
+    coords = np.stack(
+        [
+            np.stack([x0, y0], axis=1),
+            np.stack([x1, y0], axis=1),
+            np.stack([x1, y1], axis=1),
+            np.stack([x0, y1], axis=1),
+        ],
+        axis=1,
+    )
+    return shapely.polygons(coords)
+
+
+def create_sample_parcels():
+    """Build a handful of rectangular sample parcels (EPSG:5070)."""
+    x0 = np.arange(5) * 1200.0
+    bounds = np.column_stack([x0, np.zeros(5), x0 + 1000.0, np.full(5, 1000.0)])
+    geometries = _make_rect_polygons(bounds)
+
+    rng = np.random.default_rng(0)
+    n = len(geometries)
+    parcel_ids = [f"PARCEL_{i + 1:03d}" for i in range(n)]
+    parcels_data = {
+        "APN": parcel_ids,
+        "COUNTY": ["MCLEAN"] * n,
+        "STATE": ["IL"] * n,
+        "parcel_id": parcel_ids,
+        "acres": rng.uniform(50, 200, size=n),
+        "landuse": ["farmland"] * n,
+        "geometry": geometries,
+    }
+    return gpd.GeoDataFrame(parcels_data, crs="EPSG:5070")
+
+
+def create_sample_soils():
+    """Build SSURGO-style soil polygons overlapping the sample parcels."""
+    taxorders = ["Mollisols", "Alfisols", "Inceptisols", "Entisols", "Histosols"]
+    rng = np.random.default_rng(1)
+    n = len(taxorders)
+
+    x0 = np.arange(n) * 1200.0 - 100.0
+    bounds = np.column_stack([x0, np.full(n, -100.0), x0 + 1200.0, np.full(n, 1100.0)])
+    geometries = _make_rect_polygons(bounds)
+
+    soils_data = {
+        "mukey": [f"{100000 + i}" for i in range(n)],
+        "muname": [f"Sample silt loam {i + 1}" for i in range(n)],
+        "taxorder": taxorders,
+        "slope_r": rng.uniform(0, 12, size=n),
+        "om_r": rng.uniform(1, 6, size=n),
+        "kwfact": rng.uniform(0.15, 0.49, size=n),
+        "geometry": geometries,
+    }
+    return gpd.GeoDataFrame(soils_data, crs="EPSG:5070")
+
+
+def create_sample_roads():
+    """Build a sparse road network running past the sample parcels."""
+    n = 3
+    y = -200.0 - np.arange(n) * 400.0
+    coords = np.stack(
+        [
+            np.column_stack([np.full(n, -500.0), y]),
+            np.column_stack([np.full(n, 6500.0), y]),
+        ],
+        axis=1,
+    )
+    roads_data = {
+        "road_id": [f"ROAD_{i + 1:02d}" for i in range(n)],
+        "highway": ["tertiary"] * n,
+        "geometry": shapely.linestrings(coords),
+    }
+    return gpd.GeoDataFrame(roads_data, crs="EPSG:5070")
+
+
+def create_sample_aoi():
+    """Build a single AOI boundary polygon covering the fixture layers."""
+    geom = Polygon([(-600.0, -1600.0), (6600.0, -1600.0), (6600.0, 1200.0), (-600.0, 1200.0)])
+    return gpd.GeoDataFrame(
+        {"name": ["sample_aoi"], "geometry": [geom]}, crs="EPSG:5070"
+    )
+
+
+def create_sample_nlcd():
+    """Build a small NLCD landcover summary table (already vectorized)."""
+    rng = np.random.default_rng(42)
+    parcel_ids = [f"PARCEL_{i + 1:03d}" for i in range(5)]
+    return pd.DataFrame(
+        {
+            "parcel_id": parcel_ids,
+            "nlcd_class": rng.choice([81, 82], size=len(parcel_ids)),
+            "pct_cover": rng.uniform(60, 100, size=len(parcel_ids)).round(1),
+        }
+    )
+
+
+def create_negative_list():
+    """Build the program negative list keyed by state/county."""
+    return pd.DataFrame(
+        {
+            "state": ["IL", "IL", "IN"],
+            "county": ["COOK", "DUPAGE", "LAKE"],
+            "status": ["INELIGIBLE", "INELIGIBLE", "REVIEW"],
+        }
+    )
+
+
+def main():
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    # FlatGeobuf: streaming flat-binary writes, no SQLite transactions
+    # or journaling, and the readers get a built-in spatial index.
+    fgb_opts = {"engine": "pyogrio", "layer_options": {"SPATIAL_INDEX": "YES"}}
+
+    parcels = create_sample_parcels()
+    parcels.to_file(os.path.join(DATA_DIR, "parcels.fgb"), driver="FlatGeobuf", **fgb_opts)
+
+    soils = create_sample_soils()
+    soils.to_file(os.path.join(DATA_DIR, "ssurgo.fgb"), driver="FlatGeobuf", **fgb_opts)
+
+    roads = create_sample_roads()
+    roads.to_file(os.path.join(DATA_DIR, "roads.fgb"), driver="FlatGeobuf", **fgb_opts)
+
+    aoi = create_sample_aoi()
+    aoi.to_file(os.path.join(DATA_DIR, "aoi.fgb"), driver="FlatGeobuf", **fgb_opts)
+
+    nlcd = create_sample_nlcd()
+    pacsv.write_csv(
+        pa.Table.from_pandas(nlcd, preserve_index=False),
+        os.path.join(DATA_DIR, "nlcd_2021.csv"),
+    )
+
+    negative_list = create_negative_list()
+    pacsv.write_csv(
+        pa.Table.from_pandas(negative_list, preserve_index=False),
+        os.path.join(DATA_DIR, "negative_list.csv"),
+    )
+
+    print(f"Sample data written to {DATA_DIR}/")
+
+
+if __name__ == "__main__":
+    main()
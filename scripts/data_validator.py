@@ -0,0 +1,287 @@
+"""Validate and enrich parcel data for SEP program screening.
+
+``CountyDataIntegrator`` pulls parcel attributes from county assessor
+endpoints, ``USDADataIntegrator`` looks up dominant soil components
+through the USDA Soil Data Access (SDA) service, and ``DataValidator``
+ties the two together and enforces the minimum data quality the
+screening scripts assume.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import geopandas as gpd
+import numpy as np
+import orjson
+import pandas as pd
+import requests
+import requests_cache
+import shapely
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional accelerator
+    njit = prange = None
+
+logger = logging.getLogger(__name__)
+
+SDA_URL = "https://sdmdataaccess.nrcs.usda.gov/Tabular/post.rest"
+
+# Pre-built SQL templates and JSON body fragments: only the WKTs vary
+# per call, so the constant ~1 KB of SQL is never re-assembled and the
+# request body skips a JSON-encode. WKTs are single-quote escaped before
+# substitution.
+_SDA_SQL_TMPL = (
+    "SELECT TOP 1 c.taxorder, c.slope_r, c.om_r, c.kwfact, mu.muname "
+    "FROM SDA_Get_Mukey_from_intersection_with_WktWgs84('%s') AS a "
+    "INNER JOIN mapunit mu ON mu.mukey = a.mukey "
+    "INNER JOIN component c ON c.mukey = mu.mukey AND c.majcompflag = 'Yes' "
+    "ORDER BY a.area_acres DESC"
+)
+_SDA_BULK_SQL_TMPL = (
+    "WITH parcels(idx, wkt) AS (VALUES %s) "
+    "SELECT parcels.idx, c.taxorder, c.slope_r, c.om_r, c.kwfact, "
+    "mu.muname, a.area_acres "
+    "FROM parcels "
+    "CROSS APPLY SDA_Get_Mukey_from_intersection_with_WktWgs84(parcels.wkt) AS a "
+    "INNER JOIN mapunit mu ON mu.mukey = a.mukey "
+    "INNER JOIN component c ON c.mukey = mu.mukey AND c.majcompflag = 'Yes'"
+)
+_SDA_BODY_PREFIX = b'{"format":"JSON+COLUMNNAME","query":"'
+_SDA_BODY_SUFFIX = b'"}'
+
+
+def _sda_body(query):
+    """Build the SDA POST body around a template-generated query."""
+    return _SDA_BODY_PREFIX + query.encode() + _SDA_BODY_SUFFIX
+
+
+def _mount_retrying_adapter(session, pool_size=16):
+    """Give a session keep-alive connection pooling and retry-with-backoff.
+
+    Amortizes the TLS handshake across requests and turns transient SDA
+    and assessor 5xx/429 responses into automatic retries instead of
+    failed runs.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods={"POST", "GET"},
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+class CountyDataIntegrator:
+    """Fetch parcel attributes from a county assessor endpoint."""
+
+    def __init__(self, base_url=None):
+        self.base_url = base_url
+        self.session = requests.Session()
+        _mount_retrying_adapter(self.session)
+
+    def fetch_parcels(self, county, state):
+        """Fetch parcels for a county; returns None when no endpoint is configured."""
+        if not self.base_url:
+            logger.info("No assessor endpoint configured for %s, %s", county, state)
+            return None
+        response = self.session.get(
+            self.base_url, params={"county": county, "state": state}, timeout=60
+        )
+        response.raise_for_status()
+        return gpd.GeoDataFrame.from_features(response.json()["features"])
+
+
+class USDADataIntegrator:
+    """Query USDA Soil Data Access for dominant soil components."""
+
+    _BULK_BATCH_SIZE = 100
+    _MAX_WORKERS = 8
+
+    def __init__(self):
+        # SDA responses are persisted on disk so repeated CLI runs over
+        # the same parcels skip the network entirely.
+        self.session = requests_cache.CachedSession(
+            "data/sda_cache",
+            backend="sqlite",
+            expire_after=30 * 86400,
+            allowable_methods=("POST",),
+            allowable_codes=(200,),
+        )
+        _mount_retrying_adapter(self.session, pool_size=self._MAX_WORKERS)
+
+    def get_soil_data(self, wkt):
+        """Return dominant-component soil attributes for one WGS84 WKT polygon."""
+        query = _SDA_SQL_TMPL % wkt.replace("'", "''")
+        try:
+            response = self.session.post(
+                SDA_URL,
+                data=_sda_body(query),
+                headers={"Content-Type": "application/json"},
+                timeout=60,
+            )
+            response.raise_for_status()
+            table = orjson.loads(response.content).get("Table")
+        except requests.RequestException as exc:
+            logger.warning("SDA request failed: %s", exc)
+            return None
+
+        if not table or len(table) < 2:
+            return None
+
+        columns, values = table[0], table[1]
+        record = dict(zip(columns, values))
+        return {
+            "taxorder": record.get("taxorder"),
+            "slope_r": _to_float(record.get("slope_r")),
+            "om_r": _to_float(record.get("om_r")),
+            "kwfact": _to_float(record.get("kwfact")),
+            "muname": record.get("muname"),
+        }
+
+    def _fetch_soil_batch(self, pairs):
+        """Fetch one VALUES batch of ``(idx, wkt)`` pairs as raw SDA rows."""
+        values = ",".join(
+            "({}, '{}')".format(i, wkt.replace("'", "''")) for i, wkt in pairs
+        )
+        query = _SDA_BULK_SQL_TMPL % values
+        try:
+            response = self.session.post(
+                SDA_URL,
+                data=_sda_body(query),
+                headers={"Content-Type": "application/json"},
+                timeout=300,
+            )
+            response.raise_for_status()
+            table = orjson.loads(response.content).get("Table")
+        except requests.RequestException as exc:
+            logger.warning("SDA bulk request failed: %s", exc)
+            return pd.DataFrame()
+
+        if not table or len(table) < 2:
+            return pd.DataFrame()
+        return pd.DataFrame(table[1:], columns=table[0])
+
+    def get_soil_data_bulk(self, wkts):
+        """Return dominant-component soil attributes for many WKT polygons.
+
+        Splits the parcel set into VALUES batches and fetches them
+        concurrently over the pooled session, so N parcels cost
+        ceil(N / batch size) overlapped round-trips. The returned frame
+        is indexed by the position of each WKT in ``wkts``; parcels with
+        no SDA match are absent.
+        """
+        pairs = list(enumerate(wkts))
+        batches = [
+            pairs[i : i + self._BULK_BATCH_SIZE]
+            for i in range(0, len(pairs), self._BULK_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as executor:
+            frames = [f for f in executor.map(self._fetch_soil_batch, batches) if not f.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        result = pd.concat(frames, ignore_index=True)
+        for col in ("idx", "slope_r", "om_r", "kwfact", "area_acres"):
+            result[col] = pd.to_numeric(result[col], errors="coerce")
+        result["idx"] = result["idx"].astype(int)
+        # Keep the dominant (largest-area) component per parcel.
+        result = result.sort_values("area_acres", ascending=False).groupby("idx").first()
+        return result
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True)
+    def _positive_acres_mask(acres):
+        """Fused single-pass acreage predicate over a contiguous float64 array."""
+        out = np.empty(acres.shape[0], dtype=np.bool_)
+        for i in prange(acres.shape[0]):
+            out[i] = acres[i] > 0.0
+        return out
+
+else:
+
+    def _positive_acres_mask(acres):
+        """NumPy fallback when numba is not installed."""
+        return acres > 0.0
+
+
+class DataValidator:
+    """Validate parcel frames and enrich them with USDA soil attributes."""
+
+    def validate_parcel_data(self, gdf):
+        """Drop parcels missing critical fields, with bad geometry or duplicated APNs."""
+        critical_fields = ["apn", "county", "acres"]
+        mask = np.ones(len(gdf), dtype=bool)
+        existing = [field for field in critical_fields if field in gdf.columns]
+        if existing:
+            mask &= gdf[existing].notna().all(axis=1).to_numpy()
+
+        mask &= _positive_acres_mask(gdf["acres"].astype(float).to_numpy())
+        # Vectorized GEOS validity check: one C loop, no per-row dispatch.
+        mask &= shapely.is_valid(np.asarray(gdf.geometry.values))
+        mask &= ~gdf["apn"].duplicated().to_numpy()
+        return gdf.loc[mask].reset_index(drop=True)
+
+    def enrich_parcel_data(self, gdf, usda_integrator):
+        """Attach dominant soil attributes to each parcel via one bulk SDA query.
+
+        Expects ``gdf`` in EPSG:4326 so parcel WKTs can be sent to SDA
+        directly. Parcels missing from the bulk response fall back to
+        per-parcel lookups.
+        """
+        # One C-level WKT dump for all geometries; 6 decimal places
+        # (~10 cm at the equator) keeps the SDA payload small.
+        wkts = shapely.to_wkt(np.asarray(gdf.geometry.values), rounding_precision=6)
+        soil = usda_integrator.get_soil_data_bulk(wkts)
+        if soil.empty:
+            soil = pd.DataFrame(
+                columns=["taxorder", "slope_r", "om_r", "kwfact", "muname"],
+                index=range(len(gdf)),
+            )
+        else:
+            soil = soil.reindex(range(len(gdf)))
+        soil.index = gdf.index
+
+        gdf["soil_order"] = soil["taxorder"]
+        gdf["slope_pct"] = soil["slope_r"]
+        gdf["organic_matter"] = soil["om_r"]
+        gdf["erodibility"] = soil["kwfact"]
+        gdf["soil_name"] = soil["muname"]
+
+        # Fall back to per-parcel lookups for anything the bulk query missed.
+        missing = gdf.index[soil["taxorder"].isna()]
+        positions = gdf.index.get_indexer(missing)
+        # Plain tuples instead of per-row Series; position 0 is the index.
+        apn_pos = list(gdf.columns).index("apn") + 1 if "apn" in gdf.columns else 0
+        results = []
+        for pos, row in zip(positions, gdf.loc[missing].itertuples(index=True, name=None)):
+            record = usda_integrator.get_soil_data(wkts[pos])
+            if not record:
+                logger.warning("No soil data for parcel %s", row[apn_pos])
+            results.append(record or {})
+
+        if results:
+            fallback = pd.DataFrame(results, index=missing).reindex(
+                columns=["taxorder", "slope_r", "om_r", "kwfact", "muname"]
+            )
+            gdf.loc[
+                missing,
+                ["soil_order", "slope_pct", "organic_matter", "erodibility", "soil_name"],
+            ] = fallback.to_numpy()
+
+        return gdf
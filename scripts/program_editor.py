@@ -0,0 +1,224 @@
+"""Interactive editor for the SEP program configuration file.
+
+Lets program managers inspect and adjust screening requirements and
+scoring weights in ``sep_programs.json`` without editing JSON by hand.
+"""
+
+import ast
+import json
+import os
+import sys
+from datetime import datetime
+
+import orjson
+
+
+def _parse_value(raw):
+    """Parse an edited requirement value into bool, number, list or string.
+
+    A single ast.literal_eval pass replaces the old isdigit/replace
+    scans, which also rejected negative numbers and exponents.
+    """
+    text = raw.strip()
+    low = text.lower()
+    if low in ("true", "false"):
+        return low == "true"
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        # Unquoted bracket lists like [farmland, meadow] are how users
+        # type allowed_landuse; split them by hand.
+        if text.startswith("[") and text.endswith("]"):
+            return [
+                item.strip().strip("'\"")
+                for item in text[1:-1].split(",")
+                if item.strip()
+            ]
+        return text
+
+
+class ProgramConfigEditor:
+    """Load, edit and persist the SEP program configuration."""
+
+    def __init__(self, config_file="sep_programs.json"):
+        self.config_file = config_file
+        self.config = self.load_config()
+        # Single shared reference; every method goes through this dict.
+        self.programs = self.config.setdefault("programs", {})
+
+    def load_config(self):
+        """Read the program configuration from disk."""
+        if not os.path.exists(self.config_file):
+            return {"programs": {}}
+        with open(self.config_file, "rb") as f:
+            return orjson.loads(f.read())
+
+    def save_config(self):
+        """Write the program configuration back to disk."""
+        with open(self.config_file, "wb") as f:
+            f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        print(f"Saved {self.config_file}")
+
+    def list_programs(self):
+        """Print a short listing of every configured program."""
+        if not self.programs:
+            print("No programs configured.")
+            return
+        lines = []
+        for key, program in self.programs.items():
+            reqs = program.get("requirements", {})
+            lines.append(f"- {key}")
+            lines.append(f"    name: {program.get('name', '?')}")
+            lines.append(f"    description: {program.get('description', '')}")
+            lines.append(f"    min_acres: {reqs.get('min_acres')}")
+            lines.append(f"    allowed_landuse: {reqs.get('allowed_landuse')}")
+        # One stdout write for the whole listing instead of 5 per program.
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def show_program_details(self, program_key):
+        """Print the full requirement and scoring profile of one program."""
+        program = self.programs.get(program_key)
+        if program is None:
+            print(f"Unknown program: {program_key}")
+            return
+        reqs = program.get("requirements", {})
+        scoring = program.get("scoring", {})
+        lines = [
+            "=" * 50,
+            f"Program: {program.get('name', program_key)}",
+            f"Description: {program.get('description', '')}",
+            f"Acreage: {reqs.get('min_acres')} - {reqs.get('max_acres')} acres",
+            f"Max slope: {reqs.get('max_slope_pct')}%",
+            f"Min organic matter: {reqs.get('min_organic_matter')}%",
+            f"Max erodibility (K): {reqs.get('max_erodibility')}",
+            f"Max distance to road: {reqs.get('max_dist_to_road_miles')} mi",
+            f"Allowed landuse: {reqs.get('allowed_landuse')}",
+            f"Allowed soils: {reqs.get('allowed_soils')}",
+            f"County restrictions: {reqs.get('county_restrictions')}",
+            f"Scoring weights: {scoring}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def edit_program_requirement(self, program_key, requirement, value):
+        """Set one requirement value on a program."""
+        if program_key not in self.programs:
+            print(f"Unknown program: {program_key}")
+            return False
+        program = self.programs[program_key]
+        program.setdefault("requirements", {})[requirement] = value
+        print(f"Set {program_key}.{requirement} = {value!r}")
+        return True
+
+    def create_new_program(self, program_key, name, description=""):
+        """Create an empty program skeleton under a new key."""
+        if program_key in self.programs:
+            print(f"Program already exists: {program_key}")
+            return False
+        self.programs[program_key] = {
+            "name": name,
+            "description": description,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "requirements": {},
+            "scoring": {},
+        }
+        print(f"Created program {program_key}")
+        return True
+
+    def delete_program(self, program_key):
+        """Remove a program from the configuration."""
+        if program_key not in self.programs:
+            print(f"Unknown program: {program_key}")
+            return False
+        del self.programs[program_key]
+        print(f"Deleted program {program_key}")
+        return True
+
+    def validate_program(self, program_key):
+        """Check a program for the fields the screening scripts require."""
+        program = self.programs.get(program_key)
+        if program is None:
+            print(f"Unknown program: {program_key}")
+            return False
+        problems = []
+        reqs = program.get("requirements", {})
+        for field in ("min_acres", "max_acres", "allowed_landuse"):
+            if reqs.get(field) is None:
+                problems.append(f"missing requirement: {field}")
+        if not program.get("scoring"):
+            problems.append("missing scoring weights")
+        if problems:
+            for problem in problems:
+                print(f"  ! {problem}")
+            return False
+        print(f"Program {program_key} is valid.")
+        return True
+
+    def export_program(self, program_key, out_file):
+        """Write one program definition to a standalone JSON file."""
+        program = self.programs.get(program_key)
+        if program is None:
+            print(f"Unknown program: {program_key}")
+            return False
+        with open(out_file, "w") as f:
+            json.dump({program_key: program}, f, indent=2)
+        print(f"Exported {program_key} to {out_file}")
+        return True
+
+
+MENU = (
+    "\n" + "=" * 60 + "\n"
+    "SEP Program Configuration Editor\n"
+    + "=" * 60 + "\n"
+    "1. List all programs\n"
+    "2. Show program details\n"
+    "3. Edit program requirement\n"
+    "4. Create new program\n"
+    "5. Delete program\n"
+    "6. Validate program\n"
+    "7. Export program\n"
+    "8. Save configuration\n"
+    "0. Exit\n"
+)
+
+
+def interactive_editor(config_file="sep_programs.json"):
+    """Run the menu-driven configuration editor loop."""
+    editor = ProgramConfigEditor(config_file)
+
+    while True:
+        sys.stdout.write(MENU)
+        sys.stdout.flush()
+        choice = input("Select an option: ").strip()
+
+        if choice == "1":
+            editor.list_programs()
+        elif choice == "2":
+            editor.show_program_details(input("Program key: ").strip())
+        elif choice == "3":
+            program_key = input("Program key: ").strip()
+            requirement = input("Requirement name: ").strip()
+            value = _parse_value(input("Value: "))
+            editor.edit_program_requirement(program_key, requirement, value)
+        elif choice == "4":
+            program_key = input("New program key: ").strip()
+            name = input("Program name: ").strip()
+            description = input("Description: ").strip()
+            editor.create_new_program(program_key, name, description)
+        elif choice == "5":
+            editor.delete_program(input("Program key: ").strip())
+        elif choice == "6":
+            editor.validate_program(input("Program key: ").strip())
+        elif choice == "7":
+            program_key = input("Program key: ").strip()
+            out_file = input("Output file: ").strip()
+            editor.export_program(program_key, out_file)
+        elif choice == "8":
+            editor.save_config()
+        elif choice == "0":
+            break
+        else:
+            print("Unknown option.")
+
+
+if __name__ == "__main__":
+    interactive_editor()
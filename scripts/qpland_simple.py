@@ -0,0 +1,113 @@
+"""Offline variant of the qualification-pack screening.
+
+Runs the same pre-screen, negative-list, road-distance and scoring steps
+as ``qpland.py`` but reads the local fixture layers written by
+``create_sample_data.py`` instead of calling OSM or SDA, so the full
+pipeline can be exercised without network access.
+"""
+
+import os
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+CFG = {
+    "county": "MCLEAN",
+    "state": "IL",
+    "allowed_landuse": {"farmland", "meadow", "orchard"},
+    "min_acres": 40.0,
+    "max_slope_pct": 8.0,
+    "max_dist_to_road_miles": 0.5,
+    "score_w": {"acres": 25, "slope": 25, "landuse": 25, "access": 25},
+    "parcels_path": "data/parcels.fgb",
+    "soils_path": "data/ssurgo.fgb",
+    "roads_path": "data/roads.fgb",
+    "negative_csv": "data/negative_list.csv",
+    "out_dir": "out",
+}
+
+
+def score_parcels(pre):
+    """Score all screened parcels at once: boolean masks times weights."""
+    w = CFG["score_w"]
+    s = np.zeros(len(pre), dtype=np.int32)
+
+    s += np.where(pre["acres"].to_numpy() >= CFG["min_acres"], w["acres"], 0)
+
+    if CFG["max_slope_pct"] is None:
+        slope_ok = np.ones(len(pre), dtype=bool)
+    else:
+        slope = pd.to_numeric(pre["slope_pct"], errors="coerce").to_numpy()
+        slope_ok = np.isnan(slope) | (slope <= CFG["max_slope_pct"])
+    s += np.where(slope_ok, w["slope"], 0)
+
+    s += np.where(pre["landuse_ok"].to_numpy(), w["landuse"], 0)
+
+    dist = pd.to_numeric(pre["dist_road_mi"], errors="coerce").to_numpy()
+    access_ok = ~np.isnan(dist) & (dist <= CFG["max_dist_to_road_miles"])
+    s += np.where(access_ok, w["access"], 0)
+    return s
+
+
+def main():
+    os.makedirs(CFG["out_dir"], exist_ok=True)
+
+    parcels = gpd.read_file(CFG["parcels_path"])
+    soils = gpd.read_file(CFG["soils_path"])
+    roads = gpd.read_file(CFG["roads_path"])
+
+    # Pre-screen on landuse and acreage.
+    parcels["landuse_ok"] = parcels["landuse"].isin(CFG["allowed_landuse"]).to_numpy()
+    parcels["acres"] = parcels.geometry.area.to_numpy() / 4046.86
+    pre = parcels[
+        parcels["landuse_ok"] & (parcels["acres"] >= CFG["min_acres"])
+    ].copy()
+    pre = pre.reset_index(drop=True)
+    pre["county"] = CFG["county"]
+    pre["state"] = CFG["state"]
+
+    # Negative-list merge.
+    neg = pd.read_csv(CFG["negative_csv"])
+    neg["_STATE"] = neg["state"].astype(str).str.strip().str.upper()
+    neg["_COUNTY"] = neg["county"].astype(str).str.strip().str.upper()
+    pre["_STATE"] = pre["state"].astype(str).str.strip().str.upper()
+    pre["_COUNTY"] = pre["county"].astype(str).str.strip().str.upper()
+    pre = pre.merge(
+        neg[["_STATE", "_COUNTY", "status"]], on=["_STATE", "_COUNTY"], how="left"
+    )
+    pre["negative_list"] = (pre["status"] == "INELIGIBLE").to_numpy()
+    pre["stack_required"] = pre["negative_list"]
+
+    # Dominant soil per parcel from the local SSURGO fixture.
+    joined = gpd.sjoin(pre, soils[["taxorder", "slope_r", "geometry"]], how="left")
+    dominant = joined.groupby(joined.index).first()
+    pre["soil_order"] = dominant["taxorder"]
+    pre["slope_pct"] = dominant["slope_r"]
+    for column in ("county", "state", "landuse", "soil_order"):
+        pre[column] = pre[column].astype("category")
+    orders_upper = pre["soil_order"].astype(str).str.upper()
+    pre = pre[orders_upper != "HISTOSOLS"]
+
+    # Distance to the nearest road: one indexed sjoin_nearest over the
+    # parcel centroids instead of hand-rolled tree bookkeeping.
+    centroids = gpd.GeoDataFrame(geometry=pre.geometry.centroid, crs=pre.crs)
+    joined = gpd.sjoin_nearest(centroids, roads[["geometry"]], distance_col="_dist_m")
+    dists_m = joined.groupby(joined.index)["_dist_m"].first().reindex(pre.index)
+    pre["dist_road_mi"] = dists_m.to_numpy() * 0.000621371
+
+    # Fit score and outputs.
+    pre["fit_score"] = score_parcels(pre)
+    out = pre.sort_values("fit_score", ascending=False)
+    out_csv = os.path.join(CFG["out_dir"], "qualified_parcels_simple.csv")
+    pacsv.write_csv(
+        pa.Table.from_pandas(out.drop(columns="geometry"), preserve_index=False),
+        out_csv,
+    )
+    print(f"Wrote {len(out)} parcels to {out_csv}")
+
+
+if __name__ == "__main__":
+    main()
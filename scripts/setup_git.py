@@ -0,0 +1,33 @@
+"""One-time helper to put a QP workspace under git version control."""
+
+import subprocess
+
+
+def run_command(argv, description):
+    """Run one command (argv list, no shell), printing a short status line."""
+    print(f"-> {description}")
+    try:
+        subprocess.run(argv, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as exc:
+        print(f"   failed: {exc.stderr.strip()}")
+        return False
+    return True
+
+
+def main():
+    repo_url = input("Remote repository URL (blank to skip): ").strip()
+
+    if not run_command(["git", "init"], "Initializing repository"):
+        return
+    run_command(["git", "add", "."], "Staging files")
+    run_command(
+        ["git", "commit", "-m", "Initial commit: SEP QP workspace"],
+        "Creating initial commit",
+    )
+    if repo_url:
+        run_command(["git", "remote", "add", "origin", repo_url], "Adding remote origin")
+    print("Done.")
+
+
+if __name__ == "__main__":
+    main()